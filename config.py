@@ -11,6 +11,7 @@ class LogConfig:
     LOG_LEVEL = "DEBUG"  # Can be DEBUG, INFO, WARNING, ERROR, CRITICAL
     RUN_TESTS = False
     TEST_DELAY = 2  # Seconds to wait after test failures
+    TEST_GC = False  # Collect after every test when hunting memory leaks
 
 class PinConfig:
     """Pin assignments for hardware connections"""
@@ -49,6 +50,7 @@ class SystemConfig:
         'CYCLE_DELAY': 10, #seconds
         'TEMP_DIFFERENTIAL': 2.0, #degrees
         'SETPOINT': 90, #degrees
+        'MAX_TEMP': 90, #degrees, highest setpoint accepted
         'HEATER_MODE': 'off'  # Current heater mode (off/heat)
     }
     
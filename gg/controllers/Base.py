@@ -15,6 +15,10 @@ class BaseController:
         """Initialize the controller"""
         return await self.hardware.initialize()
         
+    def reset(self):
+        """Reset runtime state without re-initializing the hardware"""
+        self.enabled = True
+        
     async def monitor(self):
         """Monitor device state - must be implemented by subclasses"""
         raise NotImplementedError
@@ -15,6 +15,11 @@ class MotionController(BaseController):
     
     def __init__(self, sensor: MotionDevice, event_system):
         super().__init__(sensor, event_system)
+        self.reset()
+        
+    def reset(self):
+        """Reset motion tracking state"""
+        super().reset()
         self._last_motion_state = False
         self._sensitivity = 5  # Default sensitivity
         
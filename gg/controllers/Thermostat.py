@@ -13,11 +13,30 @@ import asyncio
 from config import SystemConfig
 
 class ThermostatController(BaseController):
-    """Controls heater based on temperature events and settings"""
+    """Controls heater based on temperature events and settings
     
-    def __init__(self, name, heater_relay, safety, events):
+    All timing goes through `clock`, a callable returning the current time
+    in seconds (time.time by default), so tests can substitute a fake clock.
+    """
+    
+    def __init__(self, name, heater_relay, safety, events, clock=time.time):
         super().__init__(name, heater_relay, safety, events)
+        self.clock = clock
         self.config = SystemConfig.get_instance()
+        self.reset()
+        
+        # Subscribe to events
+        self.events.subscribe("temperature_current", self._handle_temperature)
+        self.events.subscribe("thermostat_timer_start", self._handle_timer_start)
+        self.events.subscribe("thermostat_timer_end", self._handle_timer_end)
+        self.events.subscribe("temp_setting_changed", self._handle_setting_change)
+        
+    def reset(self):
+        """Reload settings from config and clear runtime state
+        
+        Does not touch the heater hardware or event subscriptions.
+        """
+        super().reset()
         
         # Initialize settings from config
         self._setpoint = self.config.TEMP_SETTINGS['SETPOINT']
@@ -27,17 +46,11 @@ class ThermostatController(BaseController):
         self._heater_mode = 'off'
         
         # Non-persistent state
-        self._last_off_time = time.time()
+        self._last_off_time = self.clock()
         self._last_on_time = 0
         self._current_temp = None
         self._state_manager = ThermostatStateManager(self)
         
-        # Subscribe to events
-        self.events.subscribe("temperature_current", self._handle_temperature)
-        self.events.subscribe("thermostat_timer_start", self._handle_timer_start)
-        self.events.subscribe("thermostat_timer_end", self._handle_timer_end)
-        self.events.subscribe("temp_setting_changed", self._handle_setting_change)
-        
     async def initialize(self):
         """Initialize the thermostat hardware"""
         await super().initialize()
@@ -57,6 +70,9 @@ class ThermostatController(BaseController):
             else:
                 await self._state_manager.transition(STATE_IDLE)
         elif setting == 'SETPOINT':
+            if float(value) > self.config.TEMP_SETTINGS['MAX_TEMP']:
+                error(f"Setpoint {value} above maximum")
+                return
             self._setpoint = float(value)
         elif setting == 'CYCLE_DELAY':
             self._cycle_delay = float(value)
@@ -93,7 +109,7 @@ class ThermostatController(BaseController):
         await self.events.publish("temp_setting_changed", {
             "setting": "HEATER_MODE",
             "value": "heat",
-            "timestamp": time.time()
+            "timestamp": self.clock()
         })
         return True
         
@@ -102,7 +118,7 @@ class ThermostatController(BaseController):
         await self.events.publish("temp_setting_changed", {
             "setting": "HEATER_MODE",
             "value": "off",
-            "timestamp": time.time()
+            "timestamp": self.clock()
         })
         
     async def _check_thermostat(self):
@@ -112,7 +128,7 @@ class ThermostatController(BaseController):
                 debug("Not all settings initialized yet")
                 return
                 
-            current_time = time.time()
+            current_time = self.clock()
             
             # Check minimum run time before any other checks
             if await self.hardware.is_active():
@@ -160,7 +176,7 @@ class ThermostatController(BaseController):
     async def _turn_on(self):
         """Turn heater on"""
         await self.hardware.activate()
-        self._last_on_time = time.time()
+        self._last_on_time = self.clock()
         await self.publish_event("heater_activated", {
             "temp": self._current_temp,
             "setpoint": self._setpoint,
@@ -170,7 +186,7 @@ class ThermostatController(BaseController):
     async def _turn_off(self):
         """Turn heater off"""
         await self.hardware.deactivate()
-        self._last_off_time = time.time()
+        self._last_off_time = self.clock()
         await self.publish_event("heater_deactivated", {
             "temp": self._current_temp,
             "setpoint": self._setpoint,
@@ -193,7 +209,7 @@ class ThermostatController(BaseController):
             
     async def reset_cycle_delay(self):
         """Reset cycle delay timing"""
-        self._last_off_time = time.time()
+        self._last_off_time = self.clock()
         debug("Cycle delay timer reset") 
         
     async def _handle_timer_start(self, event):
@@ -1,5 +1,4 @@
 from ..logging.Log import debug
-import time
 
 # Define states as constants
 STATE_IDLE = "idle"
@@ -22,7 +21,7 @@ class ThermostatStateManager:
     def can_transition(self, new_state):
         """Check if transition to new state is allowed"""
         if new_state == STATE_HEATING and self._state == STATE_CYCLE_DELAY:
-            time_in_delay = time.time() - self._cycle_delay_start
+            time_in_delay = self.controller.clock() - self._cycle_delay_start
             return time_in_delay >= self.controller._cycle_delay
         return True
         
@@ -38,25 +37,25 @@ class ThermostatStateManager:
         
         # Track cycle delay start time and log state changes
         if new_state == STATE_CYCLE_DELAY:
-            self._cycle_delay_start = time.time()
+            self._cycle_delay_start = self.controller.clock()
             remaining = int(self.controller._cycle_delay)
-            debug(f"Status: Temp={self.controller._current_temp}°F, "
-                  f"Setpoint={self.controller.setpoint}°F - "
-                  f"Cycle delay in effect ({remaining}s remaining)")
+            debug("Status: Temp=%s°F, Setpoint=%s°F - "
+                  "Cycle delay in effect (%ds remaining)",
+                  self.controller._current_temp, self.controller.setpoint, remaining)
                   
         elif new_state == STATE_HEATING:
-            debug(f"*** Temperature {self.controller._current_temp}°F below "
-                  f"setpoint {self.controller.setpoint}°F - turning ON ***")
+            debug("*** Temperature %s°F below setpoint %s°F - turning ON ***",
+                  self.controller._current_temp, self.controller.setpoint)
                   
         elif new_state == STATE_IDLE and self._last_state == STATE_HEATING:
-            debug(f"*** Temperature {self.controller._current_temp}°F above "
-                  f"setpoint {self.controller.setpoint}°F - turning OFF ***")
+            debug("*** Temperature %s°F above setpoint %s°F - turning OFF ***",
+                  self.controller._current_temp, self.controller.setpoint)
                   
         elif new_state == STATE_MIN_RUN:
+            now = self.controller.clock()
             remaining = int(self.controller._min_run_time - 
-                          (time.time() - self.controller._last_on_time))
-            debug(f"DEBUG: min_run_time={self.controller._min_run_time}, " +
-                  f"last_on_time={self.controller._last_on_time}, " +
-                  f"current_time={time.time()}")
+                          (now - self.controller._last_on_time))
+            debug("DEBUG: min_run_time=%s, last_on_time=%s, current_time=%s",
+                  self.controller._min_run_time, self.controller._last_on_time, now)
             if remaining > 0:
-                debug(f"Minimum run time in effect: {remaining}s remaining") 
\ No newline at end of file
+                debug("Minimum run time in effect: %ds remaining", remaining) 
\ No newline at end of file
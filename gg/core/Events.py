@@ -1,9 +1,30 @@
 from micropython import const # type: ignore
+import micropython # type: ignore
 import asyncio # noqa: F401
 
 # Event system constants
 MAX_SUBSCRIBERS = 10  # Maximum subscribers per event type
 
+def _sync_probe():
+    pass
+
+_FUNCTION_TYPE = type(_sync_probe)
+
+def is_sync_handler(handler):
+    """Check if a handler can be called without awaiting
+    
+    CPython can inspect coroutine functions directly. MicroPython has no
+    iscoroutinefunction, so only plain functions are treated as sync there;
+    anything else (closures, bound methods) falls back to the awaited path.
+    That includes sync functions decorated with @micropython.native, whose
+    type is not the plain function type, so they must be made async to be
+    subscribed safely.
+    """
+    iscoroutinefunction = getattr(asyncio, 'iscoroutinefunction', None)
+    if iscoroutinefunction is not None:
+        return not iscoroutinefunction(handler)
+    return type(handler) is _FUNCTION_TYPE
+
 class Event:
     """Event object for type safety and future extensibility
     
@@ -33,7 +54,8 @@ class EventSystem:
     """Simple event system for MicroPython"""
     
     def __init__(self):
-        self.subscribers = {}
+        self.subscribers = {}  # event_type -> tuple of handlers
+        self._all_sync = {}  # event_type -> True if no handler needs awaiting
         
     async def start(self):
         """Initialize event system"""
@@ -41,17 +63,34 @@ class EventSystem:
         
     async def stop(self):
         """Stop event system"""
-        self.subscribers.clear()
+        self.reset()
         return True
         
+    def reset(self):
+        """Drop all subscribers, keeping the dicts allocated"""
+        self.subscribers.clear()
+        self._all_sync.clear()
+        
     def subscribe(self, event_type, handler):
-        """Subscribe to an event type"""
-        if event_type not in self.subscribers:
-            self.subscribers[event_type] = []
-        self.subscribers[event_type].append(handler)
+        """Subscribe to an event type
+        
+        Handlers are kept as a tuple, rebuilt here so publish can iterate
+        it without any per-call copying.
+        """
+        self.subscribers[event_type] = self.subscribers.get(event_type, ()) + (handler,)
+        self._all_sync[event_type] = self._all_sync.get(event_type, True) and \
+            is_sync_handler(handler)
         
+    @micropython.native
     async def publish(self, event_type, data=None):
         """Publish an event"""
-        if event_type in self.subscribers:
-            for handler in self.subscribers[event_type]:
-                await handler(data)
+        handlers = self.subscribers.get(event_type)
+        if handlers is None:
+            return
+        if self._all_sync.get(event_type, True):
+            # Fast path: no handler for this event needs awaiting
+            for handler in handlers:
+                handler(data)
+            return
+        for handler in handlers:
+            await handler(data)
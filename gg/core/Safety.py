@@ -1,4 +1,5 @@
 from micropython import const #type: ignore
+import micropython # type: ignore
 
 """Safety severity levels"""
 SAFETY_LOW = 1
@@ -67,13 +68,15 @@ class SafetyMonitor:
         """Add a safety condition to monitor"""
         self.conditions[name] = check_func
         
+    @micropython.native
     async def check_safety(self):
         """Check all safety conditions"""
+        conditions = self.conditions
         results = {}
-        for name, check in self.conditions.items():
+        for name, check in conditions.items():
             try:
                 results[name] = await check()
-            except Exception as e:
+            except Exception:
                 results[name] = False
         return all(results.values())
         
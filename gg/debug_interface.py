@@ -56,18 +56,25 @@ class DebugInterface:
         _thread.start_new_thread(self._read_input, ())
 
         while self.running:
-            cmd = None
+            batch = None
             with self._lock:
                 if self.command_queue:
-                    cmd = self.command_queue.pop(0)
+                    # Take the whole backlog; the input thread starts a new list
+                    batch = self.command_queue
+                    self.command_queue = []
 
-            if cmd:
-                try:
-                    await self._handle_command(cmd)
-                except Exception as e:
-                    debug(f"Command error: {e}")
-
-            await asyncio.sleep_ms(100)
+            if batch:
+                for cmd in batch:
+                    if not self.running:
+                        break  # 'quit' already closed the logger and SD card
+                    try:
+                        await self._handle_command(cmd)
+                    except Exception as e:
+                        debug(f"Command error: {e}")
+                # Check straight away for input that arrived meanwhile
+                await asyncio.sleep_ms(0)
+            else:
+                await asyncio.sleep_ms(100)
         
         debug("Debug interface stopped")
 
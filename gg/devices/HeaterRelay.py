@@ -46,4 +46,12 @@ class HeaterRelay(RelayDevice):
         
     async def is_active(self):
         """Check if relay is active"""
-        return bool(self._pin.value()) 
\ No newline at end of file
+        return bool(self._pin.value())
+        
+    async def __aenter__(self):
+        return self
+        
+    async def __aexit__(self, *exc):
+        """Guarantee the heater is off when leaving the context"""
+        await self.deactivate()
+        return False
\ No newline at end of file
@@ -33,7 +33,7 @@ class SettingsManager:
                 return False
 
             setpoint = state['setpoint']
-            if not isinstance(setpoint, (int, float)) or not 50 <= float(setpoint) <= 90:
+            if not isinstance(setpoint, (int, float)) or not 50 <= float(setpoint) <= self.config.TEMP_SETTINGS['MAX_TEMP']:
                 error(f"Invalid setpoint value: {setpoint}")
                 return False
 
@@ -211,7 +211,7 @@ class SettingsManager:
     def _validate_temp_setting(self, setting, value):
         """Validate temperature settings"""
         if setting == 'SETPOINT':
-            return isinstance(value, (int, float)) and 30 <= float(value) <= 90
+            return isinstance(value, (int, float)) and 30 <= float(value) <= self.config.TEMP_SETTINGS['MAX_TEMP']
         elif setting == 'CYCLE_DELAY':
             return isinstance(value, (int, float)) and float(value) >= 0
         elif setting == 'MIN_RUN_TIME':
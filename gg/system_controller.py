@@ -1,3 +1,4 @@
+from micropython import const # type: ignore
 from .core.Events import EventSystem
 from .core.Rules import RulesEngine
 from .core.Safety import SafetyMonitor
@@ -10,13 +11,21 @@ from config import SystemConfig
 from gg.logging.file_logger import SimpleLogger
 import os
 
+IDLE_TIMEOUT_MS = 100  # Longest run() waits for a wake-up before the next cycle
+SYNC_INTERVAL_MS = 300000  # 5 minutes between RTC time syncs
+
 class SystemState:
-    """System state enumeration"""
-    INITIALIZING = "initializing"
-    READY = "ready"
-    RUNNING = "running"
-    ERROR = "error"
-    SHUTDOWN = "shutdown"
+    """System state enumeration
+    
+    States are small ints so comparisons stay cheap; NAMES holds the
+    strings published in system_state events.
+    """
+    INITIALIZING = const(0)
+    READY = const(1)
+    RUNNING = const(2)
+    ERROR = const(3)
+    SHUTDOWN = const(4)
+    NAMES = ("initializing", "ready", "running", "error", "shutdown")
 
 class SystemController:
     """Main controller for IoT system
@@ -42,6 +51,38 @@ class SystemController:
         self._monitoring = False
         self.logger = SimpleLogger.get_instance()
         self.timer_end_time = None
+        self._wake = asyncio.Event()
+        self._sync_task = None
+        
+        # Events that should start the next monitoring cycle right away
+        for event_type in ("temp_setting_changed", "thermostat_timer_start",
+                           "thermostat_timer_end", "controller_disabled"):
+            self.events.subscribe(event_type, self._handle_wake)
+        
+    def wake(self):
+        """Start the next monitoring cycle without waiting for the idle timeout"""
+        self._wake.set()
+        
+    async def _handle_wake(self, event):
+        """Wake the main loop when settings, timers or controllers change"""
+        self.wake()
+        
+    def reset(self):
+        """Return to the freshly constructed state, keeping the core systems
+        
+        Cancels the time sync task and forgets devices, services and rules.
+        Event subscriptions are left alone.
+        """
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            self._sync_task = None
+        self._wake.clear()
+        self._monitoring = False
+        self.timer_end_time = None
+        self.state = SystemState.INITIALIZING
+        self.devices.clear()
+        self.services.clear()
+        self.rules.rules.clear()
         
     def register_device(self, name: str, device: BaseController) -> bool:
         """Register a device controller
@@ -138,8 +179,10 @@ class SystemController:
             
             self.state = SystemState.RUNNING
             
-            # Initialize time sync tracking
-            self.last_time_sync = time.time()
+            # Periodic RTC time sync runs on its own instead of every cycle;
+            # a repeat initialize() keeps the task that is already running
+            if self._sync_task is None or self._sync_task.done():
+                self._sync_task = asyncio.create_task(self._time_sync_loop())
             
             return True
         except Exception as e:
@@ -148,27 +191,53 @@ class SystemController:
             return False
         
     async def _monitor_temperature(self, bmp390):
-        """Background task to monitor temperature"""
+        """Background task to monitor temperature
+        
+        Every reading is published in the same payload dict, so handlers of
+        temperature_current must copy any values they want to keep.
+        """
         debug("Starting temperature monitoring loop")
-        while self.state == SystemState.RUNNING:
-            temp = bmp390.get_fahrenheit()
+        payload = {"temp": None, "timestamp": None}
+        
+        # Bind the per-tick lookups once for the life of the loop
+        read_temp = bmp390.get_fahrenheit
+        publish = self.events.publish
+        now = time.time
+        sleep_ms = asyncio.sleep_ms
+        running = SystemState.RUNNING
+        
+        while self.state == running:
+            temp = read_temp()
             if temp is not None:
-                await self.events.publish("temperature_current", {
-                    "temp": temp,
-                    "timestamp": time.time()
-                })
+                payload["temp"] = temp
+                payload["timestamp"] = now()
+                await publish("temperature_current", payload)
             else:
                 error("Failed to read temperature from BMP390")
-            await asyncio.sleep_ms(100)  # Small delay between checks
+            await sleep_ms(100)  # Small delay between checks
         
     async def run(self):
-        """Run one monitoring cycle"""
-        if self._monitoring:
-            try:
-                await self._monitor_cycle()
-            except Exception as e:
-                error(f"Monitoring error: {e}")
-                self.state = SystemState.ERROR
+        """Run one monitoring cycle, then wait for the next one
+        
+        While monitoring, returns once wake() is called or IDLE_TIMEOUT_MS
+        passes, so callers can loop on run() without a delay of their own.
+        Returns False straight away, without waiting, when not monitoring.
+        """
+        if not self._monitoring:
+            return False
+            
+        try:
+            await self._monitor_cycle()
+        except Exception as e:
+            error(f"Monitoring error: {e}")
+            self.state = SystemState.ERROR
+            
+        try:
+            await asyncio.wait_for_ms(self._wake.wait(), IDLE_TIMEOUT_MS)
+        except asyncio.TimeoutError:
+            pass
+        self._wake.clear()
+        return True
                 
     async def _monitor_cycle(self):
         """Run one monitoring cycle
@@ -189,9 +258,6 @@ class SystemController:
         if not await self.safety.check_safety():
             critical("Safety check failed")
             self.state = SystemState.ERROR
-            
-        # Check if time sync needed
-        await self._check_time_sync()
         
     async def _handle_heartbeat(self, event):
         """Handle system heartbeat events
@@ -215,9 +281,20 @@ class SystemController:
         self._monitoring = False
         self.state = SystemState.SHUTDOWN
         
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            self._sync_task = None
+        
+        # Switch every device off, the heater above all
+        for name, device in self.devices.items():
+            try:
+                await device.cleanup()
+            except Exception as e:
+                error(f"Cleanup of {name} failed: {e}")
+        
         # Publish shutdown event
         await self.events.publish("system_state", {
-            "state": self.state,
+            "state": SystemState.NAMES[self.state],
             "timestamp": time.time()
         })
         
@@ -320,14 +397,17 @@ class SystemController:
                 })
                 break
         
-    async def _check_time_sync(self):
-        """Check if it's time to sync and send event if needed"""
-        SYNC_INTERVAL = 300  # 1 hour in seconds
-        current_time = time.time()
-        if current_time - self.last_time_sync >= SYNC_INTERVAL:
-            # Send sync event using events.publish instead of event_queue
-            await self.events.publish("sync_time", None)
-            self.last_time_sync = current_time
+    async def _time_sync_loop(self):
+        """Background task to request an RTC time sync every SYNC_INTERVAL_MS
+        
+        Runs while monitoring is on and is cancelled by safe_shutdown().
+        """
+        while self._monitoring:
+            await asyncio.sleep_ms(SYNC_INTERVAL_MS)
+            try:
+                await self.events.publish("sync_time", None)
+            except Exception as e:
+                error(f"Time sync error: {e}")
 
     async def handle_sync_time(self, _):
         """Handle time sync event"""
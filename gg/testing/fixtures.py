@@ -0,0 +1,53 @@
+from .microtest import TestCase
+from ..core.Events import EventSystem
+
+class FixtureTestCase(TestCase):
+    """TestCase whose fixtures are built once per class and reset per test
+    
+    Subclasses implement build(), which may be async, to create `hardware`
+    and `controller` as class attributes on the class's own `events`.
+    Before each test the subscriptions a test added are dropped and both
+    fixtures are reset(); after the last test everything is released.
+    """
+    events = None
+    hardware = None
+    controller = None
+    
+    @classmethod
+    def build(cls):
+        """Create the class's fixtures (may be async)"""
+        pass
+        
+    @classmethod
+    async def setUpClass(cls):
+        """Build the fixtures once for all tests in the class"""
+        cls.events = EventSystem()
+        pending = cls.build()
+        if pending is not None:  # async build returns a coroutine
+            await pending
+        # Subscriptions made while building, restored before each test
+        cls._subscribed = dict(cls.events.subscribers)
+        
+    @classmethod
+    def tearDownClass(cls):
+        """Release the fixtures after the last test"""
+        # Dropping the subscriptions breaks the events -> handler ->
+        # controller cycle, so refcounting frees everything
+        if cls.events is not None:
+            cls.events.reset()
+        cls.events = None
+        cls.hardware = None
+        cls.controller = None
+        cls._subscribed = None
+        
+    def setUp(self):
+        """Drop subscriptions added by the last test and reset the fixtures"""
+        events = self.events
+        events.reset()
+        for event_type, handlers in self._subscribed.items():
+            for handler in handlers:
+                events.subscribe(event_type, handler)
+        if self.hardware is not None:
+            self.hardware.reset()
+        if self.controller is not None:
+            self.controller.reset()
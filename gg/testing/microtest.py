@@ -1,8 +1,31 @@
+# Test method names per TestCase class, keyed by class so subclasses
+# never pick up a parent's cached list
+_method_cache = {}
+
 class TestCase:
     def __init__(self):
         self.failed = False
         self.failure_message = ""
 
+    @classmethod
+    def _test_methods(cls):
+        """Get the names of all test methods, discovered once per class"""
+        names = _method_cache.get(cls)
+        if names is None:
+            names = tuple(n for n in dir(cls) if n[:5] == 'test_' and callable(getattr(cls, n)))
+            _method_cache[cls] = names
+        return names
+
+    @classmethod
+    def setUpClass(cls):
+        """Optional setup before the first test in the class (may be async)"""
+        pass
+
+    @classmethod
+    def tearDownClass(cls):
+        """Optional cleanup after the last test in the class"""
+        pass
+
     def setUp(self):
         """Optional setup before each test"""
         pass
@@ -29,6 +52,13 @@ class TestCase:
             self.failure_message = msg or f"Assertion failed: {a} != {b}"
             raise AssertionError(self.failure_message)
 
+    def assertState(self, actual, expected, msg=None):
+        """Verify several values at once with a single tuple comparison"""
+        if actual != expected:
+            self.failed = True
+            self.failure_message = msg or f"State mismatch: {actual} != {expected}"
+            raise AssertionError(self.failure_message)
+
     def assertNotEqual(self, a, b, msg=None):
         if a == b:
             self.failed = True
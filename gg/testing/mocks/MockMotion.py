@@ -8,9 +8,7 @@ class MockMotion(MotionDevice):
     
     def __init__(self):
         super().__init__()
-        self._motion_detected = False
-        self._sensitivity = 5  # Mid-range default
-        self._last_reading = 0.0  # Direct assignment instead of await
+        self.reset()
         
     async def detect_motion(self):
         """Check if motion is currently detected"""
@@ -45,6 +43,13 @@ class MockMotion(MotionDevice):
         return await super().is_working()
         
     # Test helper methods
+    def reset(self):
+        """Restore the freshly constructed mock state"""
+        self._motion_detected = False
+        self._sensitivity = 5  # Mid-range default
+        self._last_reading = 0.0
+        self._error_count = 0
+        
     async def simulate_motion(self):
         """Simulate motion detection"""
         self._motion_detected = True
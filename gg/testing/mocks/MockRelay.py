@@ -5,8 +5,7 @@ class MockRelay(RelayDevice):
     
     def __init__(self):
         super().__init__()
-        self._active = False
-        self._last_reading = 0.0
+        self.reset()
         
     async def activate(self):
         """Activate mock relay"""
@@ -24,6 +23,12 @@ class MockRelay(RelayDevice):
         return self._active
         
     # Test helper methods
+    def reset(self):
+        """Restore the freshly constructed mock state"""
+        self._active = False
+        self._last_reading = 0.0
+        self._error_count = 0
+        
     async def simulate_failure(self):
         """Simulate a relay failure"""
         await self.record_error() 
\ No newline at end of file
@@ -8,9 +8,9 @@ class MockTemperature(TemperatureDevice):
     
     def __init__(self, initial_temp=20.0, initial_humidity=50.0):
         super().__init__()
-        self._temperature = initial_temp
-        self._humidity = initial_humidity
-        self._last_reading = 0.0  # Direct assignment instead of await
+        self._initial_temp = initial_temp
+        self._initial_humidity = initial_humidity
+        self.reset()
         
     async def read(self):
         """Read current mock temperature and humidity"""
@@ -22,6 +22,13 @@ class MockTemperature(TemperatureDevice):
         return await super().is_working()
         
     # Test helper methods
+    def reset(self):
+        """Restore the initial readings and clear errors"""
+        self._temperature = self._initial_temp
+        self._humidity = self._initial_humidity
+        self._last_reading = 0.0  # Direct assignment instead of await
+        self._error_count = 0
+        
     async def set_setpoint(self, temp):
         """Set the mock temperature reading"""
         self._temperature = temp
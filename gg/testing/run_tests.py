@@ -2,27 +2,79 @@ import os
 import gc
 import asyncio
 from .microtest import TestCase
+from ..core.Events import is_sync_handler
 from ..logging.Log import debug, error
+from config import LogConfig
 
-def is_test_method(name, method):
-    return name.startswith('test_') and callable(method)
+def is_async_method(func):
+    """Check if a test function was declared with async def
+    
+    Takes the function as looked up on the class, so sync tests can be
+    called directly instead of being awaited.
+    """
+    return not is_sync_handler(func)
 
-def is_async_method(method):
-    """Check if a method is async by looking for __await__"""
-    return hasattr(method, '__await__') or getattr(method, 'is_async', False)
+async def run_class(cls, results):
+    """Run one TestCase class: setUpClass, each test, then tearDownClass
+    
+    tearDownClass always runs, even when setUpClass fails, and a failure
+    in either is counted against the class.
+    """
+    cls_name = cls.__name__
+    debug(f"\nRunning {cls_name}:")
+    try:
+        try:
+            pending = cls.setUpClass()
+            if pending is not None:  # async setUpClass returns a coroutine
+                await pending
+        except Exception as e:
+            error(f"Error setting up {cls_name}: {e}")
+            results[1] += 1
+            return
+        test_instance = cls()
+        
+        # Run test methods
+        for method_name in cls._test_methods():
+            method = getattr(test_instance, method_name)
+            try:
+                message = f"  {method_name}..."
+                test_instance.setUp()
+                if is_async_method(getattr(cls, method_name)):
+                    await method()
+                else:
+                    method()
+                debug(f"{message} ✓")
+                results[0] += 1
+            except Exception as e:
+                debug(f"{message} ✗ ({str(e)})")
+                results[1] += 1
+            finally:
+                test_instance.tearDown()  # Always call tearDown
+                if LogConfig.TEST_GC:
+                    gc.collect()
+    finally:
+        try:
+            cls.tearDownClass()
+        except Exception as e:
+            error(f"Error tearing down {cls_name}: {e}")
+            results[1] += 1
+        gc.collect()  # One collection per test class
 
 def run_tests():
     """Run all tests from the tests directory"""
     debug("Running tests...")
     debug("=" * 40)
     
-    passed = 0
-    failed = 0
+    results = [0, 0]  # passed, failed
+    classes = []
+    
+    # One event loop for the whole run instead of one per async test
+    loop = asyncio.new_event_loop()
     
     # Get test files from tests directory
     tests_dir = "gg/testing/tests"
     
-    # Import and run all test files from the tests directory
+    # Import all test files from the tests directory and collect their classes
     for filename in os.listdir(tests_dir):
         if filename.startswith("test_") and filename.endswith(".py"):
             module_name = filename[:-3]  # Remove .py
@@ -30,44 +82,32 @@ def run_tests():
                 # Import the test module
                 module = __import__("gg.testing.tests." + module_name)
                 module = getattr(module.testing.tests, module_name)
-                
-                # Find test classes
+            
+                # Find test classes; imported bases like FixtureTestCase
+                # have no tests of their own and are skipped
                 for attr_name in dir(module):
                     attr = getattr(module, attr_name)
-                    if isinstance(attr, type) and issubclass(attr, TestCase) and attr != TestCase:
-                        debug(f"\nRunning {attr_name}:")
-                        test_instance = attr()
-                        
-                        # Find and run test methods
-                        for method_name in dir(test_instance):
-                            if method_name.startswith('test_'):
-                                method = getattr(test_instance, method_name)
-                                if callable(method):
-                                    try:
-                                        message = f"  {method_name}..."
-                                        if is_async_method(method):
-                                            asyncio.run(method())
-                                        else:
-                                            method()
-                                        debug(f"{message} ✓")
-                                        passed += 1
-                                    except Exception as e:
-                                        debug(f"{message} ✗ ({str(e)})")
-                                        failed += 1
-                                    finally:
-                                        test_instance.tearDown()  # Always call tearDown
-                        
-                        # Remove cleanup since we now use tearDown
-                        gc.collect()  # Still good to collect garbage between test classes
+                    if isinstance(attr, type) and issubclass(attr, TestCase) and attr._test_methods():
+                        classes.append(attr)
             except Exception as e:
                 error(f"Error loading tests from {filename}: {e}")
-                failed += 1
-            
-            gc.collect()
+                results[1] += 1
+    
+    # Automatic collection stays on: MicroPython only collects when the
+    # heap is full, and with it off a large class would hit MemoryError
+    try:
+        # One class at a time: some drive real hardware (the heater relay
+        # pin) or block the loop with time.sleep
+        for cls in classes:
+            loop.run_until_complete(run_class(cls, results))
+    finally:
+        loop.close()
+        gc.collect()  # Full collection once the whole suite has run
     
+    passed, failed = results
     debug("=" * 40)
     debug(f"Tests complete: {passed} passed, {failed} failed")
     return passed, failed
 
 if __name__ == '__main__':
-    run_tests()
\ No newline at end of file
+    run_tests()
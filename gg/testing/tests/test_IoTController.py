@@ -1,11 +1,9 @@
-from ..microtest import TestCase
+from ..fixtures import FixtureTestCase
 from ...system_controller import SystemController, SystemState
-from ...core.Events import EventSystem
 from ...controllers.Base import BaseController
 from ...interfaces.Base import BaseDevice
 from ...core.DeviceFactory import DeviceFactory
 from ...core.Safety import SafetyMonitor
-import gc
 
 class MockDevice(BaseDevice):
     """Simple mock device for testing"""
@@ -25,20 +23,25 @@ class MockController(BaseController):
     async def update(self):
         self.monitored = True
 
-class TestSystemController(TestCase):
-    def setUp(self):
-        self.events = EventSystem()
-        self.safety = SafetyMonitor()
-        self.device_factory = DeviceFactory()
-        self.controller = SystemController(
-            event_system=self.events,
-            safety_monitor=self.safety
+class TestSystemController(FixtureTestCase):
+    @classmethod
+    def build(cls):
+        cls.safety = SafetyMonitor()
+        cls.device_factory = DeviceFactory()
+        cls.controller = SystemController(
+            event_system=cls.events,
+            safety_monitor=cls.safety
         )
         
-    def tearDown(self):
-        self.controller = None
-        self.device_factory = None
-        gc.collect()
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        cls.device_factory = None
+        cls.safety = None
+        
+    def setUp(self):
+        super().setUp()
+        self.safety.conditions.clear()
         
     async def test_initialization(self):
         """Test system initialization"""
@@ -3,7 +3,6 @@ from ...controllers.Base import BaseController
 from ...core.Events import EventSystem
 from ...core.Safety import SafetyMonitor
 from ..mocks.MockDoor import MockDoor
-import gc
 
 class TestBaseController(TestCase):
     def __init__(self):
@@ -29,7 +28,6 @@ class TestBaseController(TestCase):
         self.hardware = None
         self.events = None
         self.safety = None
-        gc.collect()
         
     async def test_cleanup(self):
         """Test cleanup handling"""
@@ -3,7 +3,6 @@ from ...controllers.Door import DoorController
 from ...core.Events import EventSystem
 from ...core.Safety import SafetyMonitor
 from ..mocks.MockDoor import MockDoor
-import gc
 
 class TestDoorController(TestCase):
     def setUp(self):
@@ -17,7 +16,6 @@ class TestDoorController(TestCase):
         self.hardware = None
         self.events = None
         self.safety = None
-        gc.collect()
         
     async def test_initialization(self):
         result = await self.controller.initialize()
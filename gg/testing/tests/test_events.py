@@ -1,21 +1,21 @@
 from ..microtest import TestCase
 from ...core.Events import EventSystem, MAX_SUBSCRIBERS
-import gc
+
+_sync_calls = []
+
+def _sync_handler(event):
+    """Plain (non-async) handler for the publish fast path"""
+    _sync_calls.append(event)
 
 class TestEvents(TestCase):
     def __init__(self):
         """Initialize the test case"""
         super().__init__()
-        self.events = None
-        
-    def setUp(self):
-        """Initialize test components"""
         self.events = EventSystem()
         
     def tearDown(self):
         """Clean up after test"""
-        self.events = None
-        gc.collect()
+        self.events.reset()
         
     async def test_handler(self):
         """Test event handler registration and execution"""
@@ -30,6 +30,14 @@ class TestEvents(TestCase):
         await self.events.publish("test_event")
         self.assertTrue(handler_called)
         
+    async def test_sync_handler(self):
+        """Test sync handlers are called without awaiting"""
+        _sync_calls.clear()
+        self.events.subscribe("test_event", _sync_handler)
+        await self.events.publish("test_event", {"type": "test_event"})
+        self.assertEqual(len(_sync_calls), 1)
+        self.assertEqual(_sync_calls[0]["type"], "test_event")
+        
     async def test_subscribe(self):
         """Test event subscription"""
         async def test_handler(event):
@@ -1,54 +1,46 @@
 from ..microtest import TestCase
 from ...devices.HeaterRelay import HeaterRelay
-import gc
 import time
 
 class TestHeaterRelay(TestCase):
-    def __init__(self):
-        """Initialize the test case"""
-        super().__init__()
-        self.heater = None
-        
-    def setUp(self):
-        """Initialize test components"""
-        self.heater = HeaterRelay()
-        
-    def tearDown(self):
-        """Clean up after test"""
-        if self.heater:
-            self.heater._pin.off()  # Direct pin control for cleanup
-            time.sleep(1)  # Safety delay
-        self.heater = None
-        gc.collect()
+    """Heater relay tests
+    
+    Each test drives the relay inside `async with HeaterRelay()`, which
+    guarantees the relay is switched off when the test exits.
+    """
         
     async def test_initialization(self):
         """Test heater relay initialization"""
-        self.assertFalse(await self.heater.is_active())
+        async with HeaterRelay() as heater:
+            self.assertFalse(await heater.is_active())
         
     async def test_activation(self):
         """Test heater relay activation"""
-        await self.heater.activate()
-        time.sleep(1)  # Allow relay to settle
-        self.assertTrue(await self.heater.is_active())
+        async with HeaterRelay() as heater:
+            await heater.activate()
+            time.sleep(1)  # Allow relay to settle
+            self.assertTrue(await heater.is_active())
         
     async def test_deactivation(self):
         """Test heater relay deactivation"""
-        # First activate
-        await self.heater.activate()
-        time.sleep(1)  # Allow relay to settle
-        self.assertTrue(await self.heater.is_active())
-        
-        # Then deactivate
-        await self.heater.deactivate()
-        time.sleep(1)  # Allow relay to settle
-        self.assertFalse(await self.heater.is_active())
+        async with HeaterRelay() as heater:
+            # First activate
+            await heater.activate()
+            time.sleep(1)  # Allow relay to settle
+            self.assertTrue(await heater.is_active())
+            
+            # Then deactivate
+            await heater.deactivate()
+            time.sleep(1)  # Allow relay to settle
+            self.assertFalse(await heater.is_active())
         
     async def test_rapid_switching(self):
         """Test protection against rapid switching"""
-        await self.heater.activate()
-        time.sleep(1)
-        await self.heater.deactivate()
-        
-        # Try to activate before cycle delay
-        with self.assertRaises(ValueError):
-            await self.heater.activate() 
\ No newline at end of file
+        async with HeaterRelay() as heater:
+            await heater.activate()
+            time.sleep(1)
+            await heater.deactivate()
+            
+            # Try to activate before cycle delay
+            with self.assertRaises(ValueError):
+                await heater.activate()
\ No newline at end of file
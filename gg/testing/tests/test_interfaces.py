@@ -3,7 +3,29 @@ from ...interfaces.Base import BaseDevice
 from ...interfaces.Door import DoorDevice
 from ...interfaces.Temperature import TemperatureDevice
 from ...interfaces.Motion import MotionDevice
-import gc
+
+# Required interface methods missing from each device class, resolved at import
+_DOOR_MISSING = tuple(m for m in (
+    'is_open',
+    'is_locked',
+    'lock',
+    'unlock',
+    'is_working'
+) if not hasattr(DoorDevice, m))
+
+_TEMPERATURE_MISSING = tuple(m for m in (
+    'get_fahrenheit',
+    'get_celsius',
+    'is_working'
+) if not hasattr(TemperatureDevice, m))
+
+_MOTION_MISSING = tuple(m for m in (
+    'detect_motion',
+    'get_last_motion',
+    'get_sensitivity',
+    'set_sensitivity',
+    'is_working'
+) if not hasattr(MotionDevice, m))
 
 class TestBaseInterface(TestCase):
     def __init__(self):
@@ -18,7 +40,6 @@ class TestBaseInterface(TestCase):
     def tearDown(self):
         """Clean up after test"""
         self.device = None
-        gc.collect()
         
     async def test_error_tracking(self):
         """Test error counting functionality"""
@@ -42,39 +63,14 @@ class TestBaseInterface(TestCase):
 class TestDoorInterface(TestCase):
     def test_required_methods(self):
         """Verify required methods"""
-        required_methods = [
-            'is_open',
-            'is_locked',
-            'lock',
-            'unlock',
-            'is_working'
-        ]
-        
-        for method in required_methods:
-            self.assertTrue(hasattr(DoorDevice, method))
+        self.assertEqual(_DOOR_MISSING, ())
             
 class TestTemperatureInterface(TestCase):
     def test_required_methods(self):
         """Verify required methods"""
-        required_methods = [
-            'get_fahrenheit',
-            'get_celsius',
-            'is_working'
-        ]
-        
-        for method in required_methods:
-            self.assertTrue(hasattr(TemperatureDevice, method))
+        self.assertEqual(_TEMPERATURE_MISSING, ())
             
 class TestMotionInterface(TestCase):
     def test_required_methods(self):
         """Verify required methods"""
-        required_methods = [
-            'detect_motion',
-            'get_last_motion',
-            'get_sensitivity',
-            'set_sensitivity',
-            'is_working'
-        ]
-        
-        for method in required_methods:
-            self.assertTrue(hasattr(MotionDevice, method)) 
\ No newline at end of file
+        self.assertEqual(_MOTION_MISSING, ()) 
\ No newline at end of file
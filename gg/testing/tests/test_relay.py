@@ -1,7 +1,7 @@
 from ..microtest import TestCase
+from ..fixtures import FixtureTestCase
 from ...interfaces.Relay import RelayDevice
 from ..mocks.MockRelay import MockRelay
-import gc
 
 class TestRelayInterface(TestCase):
     def test_required_methods(self):
@@ -16,26 +16,23 @@ class TestRelayInterface(TestCase):
         for method in required_methods:
             self.assertTrue(hasattr(RelayDevice, method))
 
-class TestRelay(TestCase):
-    def setUp(self):
-        self.relay = MockRelay()
-        
-    def tearDown(self):
-        self.relay = None
-        gc.collect()
+class TestRelay(FixtureTestCase):
+    @classmethod
+    def build(cls):
+        cls.hardware = MockRelay()
         
     async def test_activation(self):
         """Test basic relay activation"""
-        self.assertFalse(await self.relay.is_active())
-        await self.relay.activate()
-        self.assertTrue(await self.relay.is_active())
-        await self.relay.deactivate()
-        self.assertFalse(await self.relay.is_active())
+        self.assertFalse(await self.hardware.is_active())
+        await self.hardware.activate()
+        self.assertTrue(await self.hardware.is_active())
+        await self.hardware.deactivate()
+        self.assertFalse(await self.hardware.is_active())
         
     async def test_error_handling(self):
         """Test relay error handling"""
-        self.assertTrue(await self.relay.is_working())
-        await self.relay.simulate_failure()
-        await self.relay.simulate_failure()
-        await self.relay.simulate_failure()
-        self.assertFalse(await self.relay.is_working()) 
\ No newline at end of file
+        self.assertTrue(await self.hardware.is_working())
+        await self.hardware.simulate_failure()
+        await self.hardware.simulate_failure()
+        await self.hardware.simulate_failure()
+        self.assertFalse(await self.hardware.is_working()) 
\ No newline at end of file
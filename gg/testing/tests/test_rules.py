@@ -4,27 +4,32 @@ from ...core.Rules import (
     PRIORITY_LOW, PRIORITY_MEDIUM, PRIORITY_HIGH, PRIORITY_CRITICAL
 )
 from ...core.Events import EventSystem
-import gc
+
+# One event system for the whole module, reset before each test
+_EVENTS = EventSystem()
+
+# Shared callables so tests don't build a new lambda per rule/condition
+_TRUE = lambda: True
+_NOOP = lambda: None
 
 class TestRules(TestCase):
     def setUp(self):
         """Initialize test components"""
-        self.events = EventSystem()
+        self.events = _EVENTS
+        self.events.reset()
         self.rules = RulesEngine(self.events)
         
     def tearDown(self):
         """Clean up after test"""
         self.rules = None
-        self.events = None
-        gc.collect()
         
     async def test_rule_creation(self):
         """Test rule creation and properties"""
         await self.rules.start()
         rule = Rule(
             name="test_rule",
-            condition_func=lambda: True,
-            action_func=lambda: None,
+            condition_func=_TRUE,
+            action_func=_NOOP,
             priority=PRIORITY_HIGH
         )
         self.assertEqual(rule.name, "test_rule")
@@ -36,8 +41,8 @@ class TestRules(TestCase):
         await self.rules.start()
         self.rules.add_rule(
             name="test_rule",
-            condition_func=lambda: True,
-            action_func=lambda: None,
+            condition_func=_TRUE,
+            action_func=_NOOP,
             priority=PRIORITY_HIGH
         )
         self.assertTrue("test_rule" in self.rules.rules)
@@ -53,7 +58,7 @@ class TestRules(TestCase):
         await self.rules.start()
         self.rules.add_rule(
             name="test_rule",
-            condition_func=lambda: True,
+            condition_func=_TRUE,
             action_func=test_action
         )
         
@@ -65,8 +70,8 @@ class TestRules(TestCase):
         for priority in [PRIORITY_LOW, PRIORITY_MEDIUM, PRIORITY_HIGH, PRIORITY_CRITICAL]:
             rule = Rule(
                 name=f"test_priority_{priority}",
-                condition_func=lambda: True,
-                action_func=lambda: None,
+                condition_func=_TRUE,
+                action_func=_NOOP,
                 priority=priority
             )
             self.assertEqual(rule.priority, priority)
@@ -75,8 +80,8 @@ class TestRules(TestCase):
         """Test rule enabling/disabling"""
         self.rules.add_rule(
             name="test_rule",
-            condition_func=lambda: True,
-            action_func=lambda: None
+            condition_func=_TRUE,
+            action_func=_NOOP
         )
         
         self.rules.disable_rule("test_rule")
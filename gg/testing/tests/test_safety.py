@@ -3,7 +3,9 @@ from ...core.Safety import (
     SafetyMonitor, SafetyCondition, SafetyStatus,
     SAFETY_LOW, SAFETY_MEDIUM, SAFETY_HIGH, SAFETY_CRITICAL
 )
-import gc
+
+# Shared callables so tests don't build a new lambda per condition
+_TRUE = lambda: True
 
 class TestSafety(TestCase):
     def setUp(self):
@@ -13,13 +15,12 @@ class TestSafety(TestCase):
     def tearDown(self):
         """Clean up after test"""
         self.safety = None
-        gc.collect()
         
     async def test_condition_creation(self):
         """Test safety condition creation and properties"""
         condition = SafetyCondition(
             name="test_condition",
-            check_func=lambda: True,
+            check_func=_TRUE,
             severity=SAFETY_HIGH
         )
         self.assertEqual(condition.name, "test_condition")
@@ -31,7 +32,7 @@ class TestSafety(TestCase):
         await self.safety.start()  # Need to start before adding conditions
         self.safety.add_condition(
             name="test_condition",
-            check_func=lambda: True,
+            check_func=_TRUE,
             severity=SAFETY_HIGH
         )
         self.assertTrue("test_condition" in self.safety.conditions)
@@ -41,7 +42,7 @@ class TestSafety(TestCase):
         await self.safety.start()
         self.safety.add_condition(
             name="always_safe",
-            check_func=lambda: True,
+            check_func=_TRUE,
             severity=SAFETY_HIGH
         )
         result = await self.safety.check_safety()
@@ -53,7 +54,7 @@ class TestSafety(TestCase):
         for level in [SAFETY_LOW, SAFETY_MEDIUM, SAFETY_HIGH, SAFETY_CRITICAL]:
             condition = SafetyCondition(
                 name=f"test_level_{level}",
-                check_func=lambda: True,
+                check_func=_TRUE,
                 severity=level
             )
             self.assertEqual(condition.severity, level) 
\ No newline at end of file
@@ -1,35 +1,31 @@
-from ..microtest import TestCase
-from ...core.Events import EventSystem
-from ...core.Safety import SafetyMonitor
+from ..fixtures import FixtureTestCase
 from ...controllers.Temperature import TemperatureController
 from ...interfaces.Temperature import TemperatureDevice
 from config import SystemConfig
-import gc
+
+_DIFF = SystemConfig.TEMP_SETTINGS['TEMP_DIFFERENTIAL']
 
 class MockTemperature(TemperatureDevice):
     """Mock temperature sensor for testing"""
     def __init__(self, temp=72.0):
+        self._initial_temp = temp
         self._temp = temp
         
+    def reset(self):
+        self._temp = self._initial_temp
+        
     def get_fahrenheit(self):
         return self._temp
         
     def get_celsius(self):
         return (self._temp - 32) * 5/9
 
-class TestTemperatureController(TestCase):
-    def setUp(self):
-        self.events = EventSystem()
-        self.safety = SafetyMonitor()
-        self.hardware = MockTemperature()
-        self.controller = TemperatureController("temp", self.hardware, self.safety, self.events)
-        
-    def tearDown(self):
-        self.controller = None
-        self.hardware = None
-        self.events = None
-        self.safety = None
-        gc.collect()
+class TestTemperatureController(FixtureTestCase):
+    @classmethod
+    async def build(cls):
+        cls.hardware = MockTemperature()
+        cls.controller = TemperatureController("temp", cls.hardware, None, cls.events)
+        await cls.controller.initialize()
         
     async def test_initialization(self):
         """Test controller initialization"""
@@ -39,17 +35,18 @@ class TestTemperatureController(TestCase):
         
     async def test_temperature_monitoring(self):
         """Test temperature monitoring and event publishing"""
-        await self.controller.initialize()
-        
-        # Track published events
-        temp_events = []
-        change_events = []
+        # Count published events, keeping only the first reading
+        temp_count = [0]
+        change_count = [0]
+        first_temp = [None]
         
         def on_current(data):
-            temp_events.append(data)
+            temp_count[0] += 1
+            if first_temp[0] is None:
+                first_temp[0] = data["temp"]
             
         def on_change(data):
-            change_events.append(data)
+            change_count[0] += 1
             
         self.events.subscribe("temperature_current", on_current)
         self.events.subscribe("temperature_changed", on_change)
@@ -59,32 +56,27 @@ class TestTemperatureController(TestCase):
         await self.controller.monitor()
         
         # Should have one current and one change event
-        self.assertEqual(len(temp_events), 1)
-        self.assertEqual(len(change_events), 1)
-        self.assertEqual(temp_events[0]["temp"], 70.0)
+        self.assertState((temp_count[0], change_count[0]), (1, 1))
+        self.assertEqual(first_temp[0], 70.0)
         
         # Set temperature within differential (shouldn't trigger change)
-        small_change = 70.0 + (SystemConfig.TEMP_SETTINGS['TEMP_DIFFERENTIAL'] * 0.5)
+        small_change = 70.0 + (_DIFF * 0.5)
         await self.hardware.set_setpoint(small_change)
         await self.controller.monitor()
         
         # Should have new current but no new change event
-        self.assertEqual(len(temp_events), 2)
-        self.assertEqual(len(change_events), 1)
+        self.assertState((temp_count[0], change_count[0]), (2, 1))
         
         # Set temperature outside differential
-        big_change = 70.0 + (SystemConfig.TEMP_SETTINGS['TEMP_DIFFERENTIAL'] * 2)
+        big_change = 70.0 + (_DIFF * 2)
         await self.hardware.set_setpoint(big_change)
         await self.controller.monitor()
         
         # Should have both new current and change events
-        self.assertEqual(len(temp_events), 3)
-        self.assertEqual(len(change_events), 2)
+        self.assertState((temp_count[0], change_count[0]), (3, 2))
         
     async def test_error_handling(self):
         """Test error handling for failed readings"""
-        await self.controller.initialize()
-        
         # Track error events
         errors = []
         def on_error(data):
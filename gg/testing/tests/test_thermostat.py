@@ -1,17 +1,20 @@
-from ..microtest import TestCase
-from ...core.Events import EventSystem
-from ...core.Safety import SafetyMonitor
+from ..fixtures import FixtureTestCase
 from ...controllers.Thermostat import ThermostatController
 from ...devices.HeaterRelay import HeaterRelay
 from config import SystemConfig
-import gc
-import time
+
+_MIN_RUN = SystemConfig.TEMP_SETTINGS['MIN_RUN_TIME']
+_CYCLE = SystemConfig.TEMP_SETTINGS['CYCLE_DELAY']
+_MAX = SystemConfig.TEMP_SETTINGS['MAX_TEMP']
 
 class MockRelay(HeaterRelay):
     """Mock relay for testing"""
     def __init__(self):
         self.active = False
         
+    def reset(self):
+        self.active = False
+        
     async def activate(self):
         self.active = True
         
@@ -21,19 +24,55 @@ class MockRelay(HeaterRelay):
     async def is_active(self):
         return self.active
 
-class TestThermostatController(TestCase):
+class FakeClock:
+    """Virtual clock that only moves when a test advances `now`
+    
+    Starts well past zero so the controller's initial _last_on_time of 0
+    reads as long ago, like it does against real time.
+    """
+    def __init__(self, start=1000000.0):
+        self.start = start
+        self.now = start
+        
+    def __call__(self):
+        return self.now
+
+class TestThermostatController(FixtureTestCase):
+    _event = {"temp": 0.0, "timestamp": 0.0}  # Reused by _send_temp
+    
+    @classmethod
+    async def build(cls):
+        cls.hardware = MockRelay()
+        cls.clock = FakeClock()
+        cls.controller = ThermostatController(
+            "thermostat", cls.hardware, None, cls.events, clock=cls.clock
+        )
+        await cls.controller.initialize()
+        
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        cls.clock = None
+        
     def setUp(self):
-        self.events = EventSystem()
-        self.safety = SafetyMonitor()
-        self.hardware = MockRelay()
-        self.controller = ThermostatController("thermostat", self.hardware, self.safety, self.events)
-        
-    def tearDown(self):
-        self.controller = None
-        self.hardware = None
-        self.events = None
-        self.safety = None
-        gc.collect()
+        self.clock.now = self.clock.start  # Rewind before the controller reads it
+        super().setUp()
+        self.clock.now += _CYCLE  # Let the start-up cycle delay elapse
+        
+    async def _set(self, setting, value):
+        """Change a setting the way SettingsManager does"""
+        await self.events.publish("temp_setting_changed", {
+            "setting": setting,
+            "value": value,
+            "timestamp": self.clock.now
+        })
+        
+    async def _send_temp(self, temp):
+        """Publish a reading, reusing one event dict"""
+        event = self._event
+        event["temp"] = temp
+        event["timestamp"] = self.clock.now
+        await self.events.publish("temperature_current", event)
         
     async def test_initialization(self):
         """Test controller initialization"""
@@ -44,144 +83,118 @@ class TestThermostatController(TestCase):
         
     async def test_setpoint_control(self):
         """Test setpoint changes"""
-        await self.controller.initialize()
-        
         # Valid setpoint
-        result = await self.controller.set_setpoint(72.0)
-        self.assertTrue(result)
+        await self._set("SETPOINT", 72.0)
         self.assertEqual(self.controller.setpoint, 72.0)
         
-        # Invalid setpoint (too high)
-        result = await self.controller.set_setpoint(SystemConfig.TEMP_SETTINGS['MAX_TEMP'] + 1)
-        self.assertFalse(result)
+        # Invalid setpoint (too high) is ignored
+        await self._set("SETPOINT", _MAX + 1)
         self.assertEqual(self.controller.setpoint, 72.0)
         
     async def test_temperature_response(self):
         """Test thermostat response to temperature changes"""
-        await self.controller.initialize()
-        await self.controller.set_setpoint(72.0)
+        await self._set("SETPOINT", 72.0)
+        await self._set("HEATER_MODE", "heat")
         
         # Simulate cold temperature
-        await self.controller.handle_temperature({
-            "temp": 70.0,
-            "timestamp": time.time()
-        })
+        await self._send_temp(70.0)
         
         # Should turn on
         self.assertTrue(await self.hardware.is_active())
         
         # Simulate warm temperature
-        await self.controller.handle_temperature({
-            "temp": 74.0,
-            "timestamp": time.time()
-        })
+        await self._send_temp(74.0)
         
         # Should turn off after minimum run time
-        time.sleep(SystemConfig.TEMP_SETTINGS['MIN_RUN_TIME'])
-        await self.controller.handle_temperature({
-            "temp": 74.0,
-            "timestamp": time.time()
-        })
+        self.clock.now += _MIN_RUN
+        await self._send_temp(74.0)
         self.assertFalse(await self.hardware.is_active())
         
     async def test_cycle_delay(self):
         """Test cycle delay enforcement"""
-        await self.controller.initialize()
-        await self.controller.set_setpoint(72.0)
+        await self._set("SETPOINT", 72.0)
+        await self._set("HEATER_MODE", "heat")
         
         # Turn on then off
-        await self.controller.handle_temperature({"temp": 70.0, "timestamp": time.time()})
+        await self._send_temp(70.0)
         self.assertTrue(await self.hardware.is_active())
         
-        await self.controller.handle_temperature({"temp": 74.0, "timestamp": time.time()})
-        time.sleep(SystemConfig.TEMP_SETTINGS['MIN_RUN_TIME'])
-        await self.controller.handle_temperature({"temp": 74.0, "timestamp": time.time()})
+        await self._send_temp(74.0)
+        self.clock.now += _MIN_RUN
+        await self._send_temp(74.0)
         self.assertFalse(await self.hardware.is_active())
         
         # Try to turn on before cycle delay
-        await self.controller.handle_temperature({"temp": 70.0, "timestamp": time.time()})
+        await self._send_temp(70.0)
         self.assertFalse(await self.hardware.is_active())
         
-        # Wait for cycle delay
-        time.sleep(SystemConfig.TEMP_SETTINGS['CYCLE_DELAY'])
-        await self.controller.handle_temperature({"temp": 70.0, "timestamp": time.time()})
+        # Let the cycle delay elapse
+        self.clock.now += _CYCLE
+        await self._send_temp(70.0)
         self.assertTrue(await self.hardware.is_active())
         
     async def test_heater_enable_disable(self):
         """Test heater enable/disable functionality"""
-        await self.controller.initialize()
-        await self.controller.set_setpoint(72.0)
+        await self._set("SETPOINT", 72.0)
         
         # Initially disabled
-        self.assertFalse(self.controller.heater_mode)
+        self.assertFalse(self.controller.heater_enabled)
         
         # Simulate cold temperature - should not turn on when disabled
-        await self.controller.handle_temperature({
-            "temp": 70.0,
-            "timestamp": time.time()
-        })
+        await self._send_temp(70.0)
         self.assertFalse(await self.hardware.is_active())
         
-        # Enable heater
-        await self.controller.enable_heater()
-        self.assertTrue(self.controller.heater_mode)
-        
-        # Now should respond to temperature
-        await self.controller.handle_temperature({
-            "temp": 70.0,
-            "timestamp": time.time()
-        })
+        # Enable heater; it responds to the last reading
+        self.assertTrue(await self.controller.enable_heater())
+        self.assertTrue(self.controller.heater_enabled)
         self.assertTrue(await self.hardware.is_active())
         
-        # Disable heater
+        # Disable heater once the minimum run time is up
+        self.clock.now += _MIN_RUN
         await self.controller.disable_heater()
-        self.assertFalse(self.controller.heater_mode)
+        self.assertFalse(self.controller.heater_enabled)
         self.assertFalse(await self.hardware.is_active())
         
     async def test_cycle_delay_after_disable(self):
         """Test cycle delay is enforced after disable/enable"""
-        await self.controller.initialize()
-        await self.controller.set_setpoint(72.0)
-        await self.controller.enable_heater()
+        await self._set("SETPOINT", 72.0)
+        await self._set("HEATER_MODE", "heat")
         
-        # Turn on then disable
-        await self.controller.handle_temperature({"temp": 70.0, "timestamp": time.time()})
+        # Turn on, then disable after the minimum run time
+        await self._send_temp(70.0)
         self.assertTrue(await self.hardware.is_active())
         
+        self.clock.now += _MIN_RUN
         await self.controller.disable_heater()
         self.assertFalse(await self.hardware.is_active())
         
         # Enable before cycle delay expires
         await self.controller.enable_heater()
-        await self.controller.handle_temperature({"temp": 70.0, "timestamp": time.time()})
+        await self._send_temp(70.0)
         self.assertFalse(await self.hardware.is_active())  # Should respect cycle delay
         
-        # Wait for cycle delay
-        time.sleep(SystemConfig.TEMP_SETTINGS['CYCLE_DELAY'])
-        await self.controller.handle_temperature({"temp": 70.0, "timestamp": time.time()})
+        # Let the cycle delay elapse
+        self.clock.now += _CYCLE
+        await self._send_temp(70.0)
         self.assertTrue(await self.hardware.is_active())
         
     async def test_min_run_time_with_disable(self):
         """Test minimum run time is enforced even when disabling"""
-        await self.controller.initialize()
-        await self.controller.set_setpoint(72.0)
-        await self.controller.enable_heater()
+        await self._set("SETPOINT", 72.0)
+        await self._set("HEATER_MODE", "heat")
         
         # Turn on heater
-        await self.controller.handle_temperature({"temp": 70.0, "timestamp": time.time()})
-        start_time = time.time()
+        await self._send_temp(70.0)
         self.assertTrue(await self.hardware.is_active())
         
         # Try to disable before minimum run time
         await self.controller.disable_heater()
-        self.assertFalse(self.controller.heater_mode)
+        self.assertFalse(self.controller.heater_enabled)
         self.assertTrue(await self.hardware.is_active())  # Should stay on until min run time
         
-        # Wait for minimum run time
-        remaining_time = (start_time + SystemConfig.TEMP_SETTINGS['MIN_RUN_TIME']) - time.time()
-        if remaining_time > 0:
-            time.sleep(remaining_time)
-            
+        # Let the minimum run time elapse
+        self.clock.now += _MIN_RUN
+        
         # Now should turn off
-        await self.controller.handle_temperature({"temp": 70.0, "timestamp": time.time()})
-        self.assertFalse(await self.hardware.is_active()) 
\ No newline at end of file
+        await self._send_temp(70.0)
+        self.assertFalse(await self.hardware.is_active())
\ No newline at end of file
@@ -2,22 +2,19 @@ import time
 import asyncio
 from config import LogConfig
 from gg.logging.Log import debug, info, warning, error, critical
-from gg.debug_interface import DebugInterface
-from gg.system_controller import SystemController
-from gg.core.DeviceFactory import DeviceFactory
-from gg.core.Events import EventSystem
-from gg.core.Safety import SafetyMonitor
 from gg.logging.file_logger import SimpleLogger
-from gg.system_interface import SystemInterface
-from gg.settings_manager import SettingsManager
+
+DEBUG = LogConfig.DEBUG
+_SEP = "=" * 40
 
 # Initialize core logging first
 logger = SimpleLogger.get_instance()
 
 # Development mode identifier
-debug("=" * 40)
-debug("DEVELOPMENT MODE")
-debug("=" * 40)
+if DEBUG:
+    debug(_SEP)
+    debug("DEVELOPMENT MODE")
+    debug(_SEP)
 
 # Run tests if enabled
 if LogConfig.RUN_TESTS:
@@ -30,59 +27,52 @@ if LogConfig.RUN_TESTS:
     except Exception as e:
         error(f"Test error: {e}")
         time.sleep(LogConfig.TEST_DELAY)
-    debug("=" * 40)
+    debug(_SEP)
 
 class GarageOS:
     def __init__(self):
         self.name = "GarageOS"
         self.version = "1.0.0"
-        try:
-            # Create core systems first
-            self.logger = SimpleLogger.get_instance()
-            self.events = EventSystem()
-            self.safety = SafetyMonitor()
-            
-            # Create settings manager (needs events and logger)
-            self.settings = SettingsManager(self.events, self.logger)
-            
-            # Create device factory
-            self.device_factory = DeviceFactory()
-            
-            # Initialize main controller with dependencies
-            self.controller = SystemController(
-                event_system=self.events,
-                safety_monitor=self.safety,
-                settings_manager=self.settings  # Pass settings manager in
-            )
-            
-            # Create system interface last since it needs everything
-            self.interface = SystemInterface(
-                self.events,
-                self.settings,
-                self.controller  # For device access
-            )
-
-            '''
-            # Create core systems
-            self.events = EventSystem()
-            self.safety = SafetyMonitor()
-            self.device_factory = DeviceFactory()
-            
-            # Initialize controller with dependencies
-            self.controller = SystemController(
-                event_system=self.events,
-                safety_monitor=self.safety
-            )
-            '''
-        except Exception as e:
-            error(f"Controller init error: {e}")
-            raise
+        
+        # Imported here so the test run above doesn't pay for them
+        from gg.system_controller import SystemController
+        from gg.core.DeviceFactory import DeviceFactory
+        from gg.core.Events import EventSystem
+        from gg.core.Safety import SafetyMonitor
+        from gg.system_interface import SystemInterface
+        from gg.settings_manager import SettingsManager
+        
+        # Create core systems first
+        self.logger = SimpleLogger.get_instance()
+        self.events = EventSystem()
+        self.safety = SafetyMonitor()
+        
+        # Create settings manager (needs events and logger)
+        self.settings = SettingsManager(self.events, self.logger)
+        
+        # Create device factory
+        self.device_factory = DeviceFactory()
+        
+        # Initialize main controller with dependencies
+        self.controller = SystemController(
+            event_system=self.events,
+            safety_monitor=self.safety,
+            settings_manager=self.settings  # Pass settings manager in
+        )
+        
+        # Create system interface last since it needs everything
+        self.interface = SystemInterface(
+            self.events,
+            self.settings,
+            self.controller  # For device access
+        )
         self.running = True
 
     async def startup(self):
         """Initialize and start the system"""
         info(f"Starting {self.name} v{self.version}")
-        info("Initializing system components...")
+        if DEBUG:
+            info("Initializing system components...")
         
         try:
             if await self.controller.initialize(device_factory=self.device_factory):
@@ -98,11 +88,16 @@ class GarageOS:
 
     async def run(self):
         """Main system run loop"""
-        info("Entering main run loop...")
+        if DEBUG:
+            info("Entering main run loop...")
+        from gg.system_controller import IDLE_TIMEOUT_MS
+        run_cycle = self.controller.run
+        sleep_ms = asyncio.sleep_ms
         try:
             while self.running:
-                await self.controller.run()
-                await asyncio.sleep_ms(100)
+                # run() paces itself while monitoring; otherwise back off here
+                if not await run_cycle():
+                    await sleep_ms(IDLE_TIMEOUT_MS)
                 
         except Exception as e:
             critical(f"Fatal system error: {e}")
@@ -120,26 +115,71 @@ class GarageOS:
         except Exception as e:
             error(f"Shutdown error: {e}")
 
+async def _first_completed(*tasks):
+    """Wait until any task finishes, then cancel and reap the rest
+    
+    MicroPython's asyncio has no wait(FIRST_COMPLETED), so every task
+    signals one shared Event when it ends. Each task is awaited only by
+    its watcher, since MicroPython can't gather a task that already has a
+    waiter. Re-raises the first error a task failed with; cancellations
+    are not errors.
+    """
+    finished = asyncio.Event()
+    errors = []
+    
+    async def watch(task):
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            errors.append(e)
+        finally:
+            finished.set()
+            
+    watchers = [asyncio.create_task(watch(task)) for task in tasks]
+    await finished.wait()
+    
+    for task in tasks:
+        if not task.done():
+            task.cancel()
+    for watcher in watchers:
+        await watcher
+    if errors:
+        raise errors[0]
+
 async def main():
-    info("Initializing GarageOS...")
+    if DEBUG:
+        info("Initializing GarageOS...")
     try:
         system = GarageOS()
         
         if await system.startup():
             info("System ready, starting main loop")
-            # Create debug interface with existing system controller
-            interface = DebugInterface(
-                events=system.events,
-                settings_manager=system.settings,
-                controller=system.controller
-            )
-            
-            # Create tasks for both system and debug interface
             system_task = asyncio.create_task(system.run())
-            interface_task = asyncio.create_task(interface.start())
             
-            # Wait for either task to complete
-            await asyncio.gather(system_task, interface_task)
+            try:
+                if DEBUG:
+                    # The serial debug console is a development tool;
+                    # production never loads it
+                    from gg.debug_interface import DebugInterface
+                    
+                    # Create debug interface with existing system controller
+                    interface = DebugInterface(
+                        events=system.events,
+                        settings_manager=system.settings,
+                        controller=system.controller
+                    )
+                    interface_task = asyncio.create_task(interface.start())
+                    
+                    # Stop both as soon as either one exits
+                    await _first_completed(system_task, interface_task)
+                else:
+                    await system_task
+            finally:
+                # However the loop ended (quit, error or cancellation),
+                # never leave the heater running
+                await system.safe_shutdown()
         else:
             info("System startup failed")
             await system.safe_shutdown()
@@ -148,7 +188,8 @@ async def main():
 
 # Handle startup and errors
 try:
-    info("Starting main asyncio loop")
+    if DEBUG:
+        info("Starting main asyncio loop")
     asyncio.run(main())
 except KeyboardInterrupt:
     info("\nSystem shutdown requested")
@@ -156,9 +197,10 @@ except Exception as e:
     error(f"Fatal error: {e}")
 finally:
     # Development-friendly shutdown
-    info("\n" + "="*40)
-    info("System stopped. Use Thonny's Stop/Restart")
-    info("to return to development mode.")
-    info("="*40 + "\n")
+    if DEBUG:
+        info("\n" + _SEP)
+        info("System stopped. Use Thonny's Stop/Restart")
+        info("to return to development mode.")
+        info(_SEP + "\n")
     # Close logger on shutdown
     logger.close()